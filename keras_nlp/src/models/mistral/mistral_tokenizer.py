@@ -17,6 +17,7 @@ from keras_nlp.src.models.mistral.mistral_backbone import MistralBackbone
 from keras_nlp.src.tokenizers.sentence_piece_tokenizer import (
     SentencePieceTokenizer,
 )
+from keras_nlp.src.utils.tensor_utils import tensor_to_list
 
 
 @keras_nlp_export("keras_nlp.models.MistralTokenizer")
@@ -71,15 +72,23 @@ class MistralTokenizer(SentencePieceTokenizer):
     def set_proto(self, proto):
         super().set_proto(proto)
         if proto is not None:
-            for token in [self.start_token, self.end_token]:
-                if token not in self.get_vocabulary():
+            # Look up all special tokens in one call to the underlying
+            # SentencePiece op instead of materializing the full vocabulary.
+            # Missing pieces map to the unknown id, so a token is present
+            # only if it round trips.
+            special_tokens = [self.start_token, self.end_token]
+            token_ids = self._sentence_piece.string_to_id(special_tokens)
+            found_tokens = tensor_to_list(
+                self._sentence_piece.id_to_string(token_ids)
+            )
+            for token, found_token in zip(special_tokens, found_tokens):
+                if found_token != token:
                     raise ValueError(
                         f"Cannot find token `'{token}'` in the provided "
                         f"`vocabulary`. Please provide `'{token}'` in your "
                         "`vocabulary` or use a pretrained `vocabulary` name."
                     )
-            self.start_token_id = self.token_to_id(self.start_token)
-            self.end_token_id = self.token_to_id(self.end_token)
+            self.start_token_id, self.end_token_id = tensor_to_list(token_ids)
         else:
             self.start_token_id = None
             self.end_token_id = None
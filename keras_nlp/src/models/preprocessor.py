@@ -19,6 +19,8 @@ from keras_nlp.src.layers.preprocessing.preprocessing_layer import (
     PreprocessingLayer,
 )
 from keras_nlp.src.utils.preset_utils import PREPROCESSOR_CONFIG_FILE
+from keras_nlp.src.utils.preset_utils import cached_presets
+from keras_nlp.src.utils.preset_utils import clear_presets_cache
 from keras_nlp.src.utils.preset_utils import find_subclass
 from keras_nlp.src.utils.preset_utils import get_preset_loader
 from keras_nlp.src.utils.preset_utils import list_presets
@@ -77,13 +79,21 @@ class Preprocessor(PreprocessingLayer):
 
     @classproperty
     def presets(cls):
-        presets = list_presets(cls)
-        # We can also load backbone presets.
-        if cls.tokenizer_cls is not None:
-            presets.update(cls.tokenizer_cls.presets)
-        for subclass in list_subclasses(cls):
-            presets.update(subclass.presets)
-        return presets
+        def merge_presets():
+            presets = list_presets(cls)
+            # We can also load backbone presets.
+            if cls.tokenizer_cls is not None:
+                presets.update(cls.tokenizer_cls.presets)
+            for subclass in list_subclasses(cls):
+                presets.update(subclass.presets)
+            return presets
+
+        return cached_presets(cls, merge_presets)
+
+    @classmethod
+    def _invalidate_presets_cache(cls):
+        """Clear merged presets, e.g. after registering new subclasses."""
+        clear_presets_cache()
 
     @classmethod
     def from_preset(
@@ -12,18 +12,18 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import inspect
 import os
 
 import keras
-from rich import console as rich_console
-from rich import markup
-from rich import table as rich_table
 
 from keras_nlp.src.api_export import keras_nlp_export
 from keras_nlp.src.utils.keras_utils import print_msg
 from keras_nlp.src.utils.pipeline_model import PipelineModel
 from keras_nlp.src.utils.preset_utils import TASK_CONFIG_FILE
 from keras_nlp.src.utils.preset_utils import TASK_WEIGHTS_FILE
+from keras_nlp.src.utils.preset_utils import cached_presets
+from keras_nlp.src.utils.preset_utils import clear_presets_cache
 from keras_nlp.src.utils.preset_utils import find_subclass
 from keras_nlp.src.utils.preset_utils import get_preset_loader
 from keras_nlp.src.utils.preset_utils import list_presets
@@ -32,6 +32,18 @@ from keras_nlp.src.utils.preset_utils import save_serialized_object
 from keras_nlp.src.utils.python_utils import classproperty
 
 
+def _find_property_names(cls):
+    """Find all attribute names that resolve to a `property` on `cls`."""
+    # Match `getattr(cls, name)`, but without triggering descriptors. Class
+    # level properties are excluded as they resolve to their value.
+    names = []
+    for name in dir(cls):
+        attr = inspect.getattr_static(cls, name, None)
+        if isinstance(attr, property) and not isinstance(attr, classproperty):
+            names.append(name)
+    return frozenset(names)
+
+
 @keras_nlp_export("keras_nlp.models.Task")
 class Task(PipelineModel):
     """Base class for all Task models.
@@ -62,19 +74,21 @@ class Task(PipelineModel):
 
     def __init__(self, *args, compile=True, **kwargs):
         super().__init__(*args, **kwargs)
-        self._functional_layer_ids = set(
-            id(layer) for layer in self._flatten_layers()
-        )
+        self._functional_layer_ids = set(map(id, self._flatten_layers()))
         self._initialized = True
         if self.backbone is not None:
             self.dtype_policy = self._backbone.dtype_policy
         if compile:
-            # Default compilation.
+            # Default compilation. This is not deferred to `fit()`, as
+            # `evaluate()` needs a compiled loss and `CausalLM.generate()` needs
+            # the sampler set by `compile()`. Optimizer variables are only
+            # created once training starts.
             self.compile()
 
     def preprocess_samples(self, x, y=None, sample_weight=None):
-        if self.preprocessor is not None:
-            return self.preprocessor(x, y=y, sample_weight=sample_weight)
+        preprocessor = self.preprocessor
+        if preprocessor is not None:
+            return preprocessor(x, y=y, sample_weight=sample_weight)
         else:
             return super().preprocess_samples(x, y, sample_weight)
 
@@ -82,11 +96,15 @@ class Task(PipelineModel):
         # Work around setattr issues for Keras 2 and Keras 3 torch backend.
         # Since all our state is covered by functional model we can route
         # around custom setattr calls.
-        is_property = isinstance(getattr(type(self), name, None), property)
-        is_unitialized = not hasattr(self, "_initialized")
-        is_torch = keras.config.backend() == "torch"
-        if is_torch and (is_property or is_unitialized):
-            return object.__setattr__(self, name, value)
+        if keras.config.backend() == "torch":
+            # Property names are resolved once per class, on first use.
+            cls = type(self)
+            property_names = cls.__dict__.get("_property_names")
+            if property_names is None:
+                property_names = _find_property_names(cls)
+                cls._property_names = property_names
+            if name in property_names or not hasattr(self, "_initialized"):
+                return object.__setattr__(self, name, value)
         return super().__setattr__(name, value)
 
     @property
@@ -97,6 +115,17 @@ class Task(PipelineModel):
     @backbone.setter
     def backbone(self, value):
         self._backbone = value
+        self.__dict__.pop("_backbone_layer_ids_cache", None)
+
+    @property
+    def _backbone_layer_ids(self):
+        # Ids of all backbone layers, skipped when saving task weights. Stored
+        # in `__dict__` directly to bypass Keras attribute tracking.
+        layer_ids = self.__dict__.get("_backbone_layer_ids_cache")
+        if layer_ids is None:
+            layer_ids = frozenset(map(id, self._backbone._flatten_layers()))
+            self.__dict__["_backbone_layer_ids_cache"] = layer_ids
+        return layer_ids
 
     @property
     def preprocessor(self):
@@ -106,10 +135,14 @@ class Task(PipelineModel):
     @preprocessor.setter
     def preprocessor(self, value):
         self._preprocessor = value
+        self.__dict__.pop("_layers_cache", None)
 
     def get_config(self):
         # Don't chain to super here. The default `get_config()` for functional
         # models is nested and cannot be passed to our Task constructors.
+        # The serialized backbone and preprocessor are intentionally not
+        # cached, their configs change with `quantize()`, `trainable` and
+        # `sequence_length` updates that do not go through our setters.
         return {
             "backbone": keras.layers.serialize(self.backbone),
             "preprocessor": keras.layers.serialize(self.preprocessor),
@@ -133,13 +166,22 @@ class Task(PipelineModel):
     @classproperty
     def presets(cls):
         """List built-in presets for a `Task` subclass."""
-        presets = list_presets(cls)
-        # We can also load backbone presets.
-        if cls.backbone_cls is not None:
-            presets.update(cls.backbone_cls.presets)
-        for subclass in list_subclasses(cls):
-            presets.update(subclass.presets)
-        return presets
+
+        def merge_presets():
+            presets = list_presets(cls)
+            # We can also load backbone presets.
+            if cls.backbone_cls is not None:
+                presets.update(cls.backbone_cls.presets)
+            for subclass in list_subclasses(cls):
+                presets.update(subclass.presets)
+            return presets
+
+        return cached_presets(cls, merge_presets)
+
+    @classmethod
+    def _invalidate_presets_cache(cls):
+        """Clear merged presets, e.g. after registering new subclasses."""
+        clear_presets_cache()
 
     @classmethod
     def from_preset(
@@ -210,17 +252,15 @@ class Task(PipelineModel):
             raise ValueError(
                 "The filename must end in `.weights.h5`. Received: filepath={filepath}"
             )
-        backbone_layer_ids = set(id(w) for w in self.backbone._flatten_layers())
         keras.saving.load_weights(
             self,
             filepath,
-            objects_to_skip=backbone_layer_ids,
+            objects_to_skip=self._backbone_layer_ids,
         )
 
     def has_task_weights(self):
-        task_weight_ids = set(id(w) for w in self.weights)
-        backbone_weight_ids = set(id(w) for w in self.backbone.weights)
-        return not task_weight_ids.issubset(backbone_weight_ids)
+        backbone_weight_ids = frozenset(map(id, self.backbone.weights))
+        return any(id(w) not in backbone_weight_ids for w in self.weights)
 
     def save_task_weights(self, filepath):
         """Save only the tasks specific weights not in the backbone."""
@@ -229,17 +269,18 @@ class Task(PipelineModel):
                 "The filename must end in `.weights.h5`. "
                 f"Received: filepath={filepath}"
             )
-
-        backbone_layer_ids = set(id(w) for w in self.backbone._flatten_layers())
         if not self.has_task_weights():
             raise ValueError(
                 f"Task {self} has no weights not in the `backbone`. "
                 "`save_task_weights()` has nothing to save."
             )
+        self._save_task_weights(filepath)
+
+    def _save_task_weights(self, filepath):
         keras.saving.save_weights(
             self,
             filepath=filepath,
-            objects_to_skip=backbone_layer_ids,
+            objects_to_skip=self._backbone_layer_ids,
         )
 
     def save_to_preset(self, preset_dir):
@@ -255,7 +296,8 @@ class Task(PipelineModel):
 
         save_serialized_object(self, preset_dir, config_file=TASK_CONFIG_FILE)
         if self.has_task_weights():
-            self.save_task_weights(os.path.join(preset_dir, TASK_WEIGHTS_FILE))
+            # Already checked for task weights, skip the public entry point.
+            self._save_task_weights(os.path.join(preset_dir, TASK_WEIGHTS_FILE))
 
         self.preprocessor.save_to_preset(preset_dir)
         self.backbone.save_to_preset(preset_dir)
@@ -263,10 +305,15 @@ class Task(PipelineModel):
     @property
     def layers(self):
         # Remove preprocessor from layers so it does not show up in the summary.
-        layers = super().layers
-        if self.preprocessor and self.preprocessor in layers:
-            layers.remove(self.preprocessor)
-        return layers
+        # The functional graph is fixed after construction, so cache the
+        # result. Stored in `__dict__` directly to bypass Keras tracking.
+        layers = self.__dict__.get("_layers_cache")
+        if layers is None:
+            preprocessor = self.preprocessor
+            layers = [x for x in super().layers if x is not preprocessor]
+            if hasattr(self, "_initialized"):
+                self.__dict__["_layers_cache"] = layers
+        return list(layers)
 
     def summary(
         self,
@@ -294,60 +341,85 @@ class Task(PipelineModel):
         if not print_fn and not keras.utils.is_interactive_logging_enabled():
             print_fn = print_msg
 
-        def highlight_number(x):
-            return f"[color(45)]{x}[/]" if x is None else f"[color(34)]{x}[/]"
-
-        def highlight_symbol(x):
-            return f"[color(33)]{x}[/]"
-
-        def bold_text(x):
-            return f"[bold]{x}[/]"
-
+        # Captured preprocessor summary not yet sent to `print_fn`.
+        pending = []
+        summary_print_fn = print_fn
         if self.preprocessor:
-            # Create a rich console for printing. Capture for non-interactive logging.
+            # Import `rich` lazily, it is only needed to print summaries.
+            from rich import console as rich_console
+
             if print_fn:
+                # Capture the preprocessor summary for non-interactive logging
+                # and emit it together with the first line of the model
+                # summary, instead of flushing it through `print_fn` alone.
                 console = rich_console.Console(
                     highlight=False, force_terminal=False, color_system=None
                 )
                 console.begin_capture()
+                self._render_preprocessor_table(console, line_length)
+                pending.append(console.end_capture())
+
+                def _print_fn(x, **kwargs):
+                    if pending:
+                        x = pending.pop() + x
+                    print_fn(x, **kwargs)
+
+                summary_print_fn = _print_fn
             else:
                 console = rich_console.Console(highlight=False)
-
-            column_1 = rich_table.Column(
-                "Tokenizer (type)",
-                justify="left",
-                width=int(0.5 * line_length),
-            )
-            column_2 = rich_table.Column(
-                "Vocab #",
-                justify="right",
-                width=int(0.5 * line_length),
-            )
-            table = rich_table.Table(
-                column_1, column_2, width=line_length, show_lines=True
-            )
-            tokenizer = self.preprocessor.tokenizer
-            tokenizer_name = markup.escape(tokenizer.name)
-            tokenizer_class = highlight_symbol(
-                markup.escape(tokenizer.__class__.__name__)
-            )
-            table.add_row(
-                f"{tokenizer_name} ({tokenizer_class})",
-                highlight_number(f"{tokenizer.vocabulary_size():,}"),
+                self._render_preprocessor_table(console, line_length)
+
+        try:
+            super().summary(
+                line_length=line_length,
+                positions=positions,
+                print_fn=summary_print_fn,
+                **kwargs,
             )
+        finally:
+            # Don't drop the preprocessor summary if the model summary printed
+            # nothing, e.g. because it raised.
+            if pending:
+                print_fn(pending.pop(), line_break=False)
 
-            # Print the to the console.
-            preprocessor_name = markup.escape(self.preprocessor.name)
-            console.print(bold_text(f'Preprocessor: "{preprocessor_name}"'))
-            console.print(table)
+    def _render_preprocessor_table(self, console, line_length):
+        """Print the preprocessor summary table to a rich console."""
+        from rich import markup
+        from rich import table as rich_table
 
-            # Output captured summary for non-interactive logging.
-            if print_fn:
-                print_fn(console.end_capture(), line_break=False)
+        def highlight_number(x):
+            return f"[color(45)]{x}[/]" if x is None else f"[color(34)]{x}[/]"
 
-        super().summary(
-            line_length=line_length,
-            positions=positions,
-            print_fn=print_fn,
-            **kwargs,
+        def highlight_symbol(x):
+            return f"[color(33)]{x}[/]"
+
+        def bold_text(x):
+            return f"[bold]{x}[/]"
+
+        column_1 = rich_table.Column(
+            "Tokenizer (type)",
+            justify="left",
+            width=int(0.5 * line_length),
         )
+        column_2 = rich_table.Column(
+            "Vocab #",
+            justify="right",
+            width=int(0.5 * line_length),
+        )
+        table = rich_table.Table(
+            column_1, column_2, width=line_length, show_lines=True
+        )
+        tokenizer = self.preprocessor.tokenizer
+        tokenizer_name = markup.escape(tokenizer.name)
+        tokenizer_class = highlight_symbol(
+            markup.escape(tokenizer.__class__.__name__)
+        )
+        table.add_row(
+            f"{tokenizer_name} ({tokenizer_class})",
+            highlight_number(f"{tokenizer.vocabulary_size():,}"),
+        )
+
+        # Print the to the console.
+        preprocessor_name = markup.escape(self.preprocessor.name)
+        console.print(bold_text(f'Preprocessor: "{preprocessor_name}"'))
+        console.print(table)
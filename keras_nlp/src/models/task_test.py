@@ -25,6 +25,8 @@ from keras_nlp.src.models.preprocessor import Preprocessor
 from keras_nlp.src.models.task import Task
 from keras_nlp.src.tests.test_case import TestCase
 from keras_nlp.src.tokenizers.tokenizer import Tokenizer
+from keras_nlp.src.utils.preset_utils import BUILTIN_PRESETS
+from keras_nlp.src.utils.preset_utils import BUILTIN_PRESETS_FOR_CLASS
 from keras_nlp.src.utils.preset_utils import CONFIG_FILE
 from keras_nlp.src.utils.preset_utils import METADATA_FILE
 from keras_nlp.src.utils.preset_utils import MODEL_WEIGHTS_FILE
@@ -32,6 +34,7 @@ from keras_nlp.src.utils.preset_utils import TASK_CONFIG_FILE
 from keras_nlp.src.utils.preset_utils import TASK_WEIGHTS_FILE
 from keras_nlp.src.utils.preset_utils import check_config_class
 from keras_nlp.src.utils.preset_utils import load_json
+from keras_nlp.src.utils.preset_utils import register_presets
 
 
 class SimpleTokenizer(Tokenizer):
@@ -62,6 +65,41 @@ class TestTask(TestCase):
         self.assertContainsSubset(bert_presets, all_presets)
         self.assertContainsSubset(gpt2_presets, all_presets)
 
+    def test_presets_cache(self):
+        # Mutating the returned dict should not affect the cached presets.
+        expected = set(Task.presets.keys())
+        Task.presets.clear()
+        self.assertEqual(set(Task.presets.keys()), expected)
+        Task._invalidate_presets_cache()
+        self.assertEqual(set(Task.presets.keys()), expected)
+
+    def test_presets_cache_invalidation(self):
+        custom_objects = keras.saving.get_custom_objects()
+        name = "keras_nlp_test>PresetsCacheTask"
+        self.addCleanup(custom_objects.pop, name, None)
+
+        class OldTask(SimpleTask):
+            pass
+
+        class NewTask(SimpleTask):
+            pass
+
+        def register_test_presets(preset):
+            handle = f"kaggle://keras_nlp_test/{preset}"
+            register_presets({preset: {"kaggle_handle": handle}}, [NewTask])
+            self.addCleanup(BUILTIN_PRESETS.pop, preset, None)
+
+        self.addCleanup(BUILTIN_PRESETS_FOR_CLASS.pop, NewTask, None)
+        custom_objects[name] = OldTask
+        register_test_presets("presets_cache_test_1")
+        self.assertNotIn("presets_cache_test_1", Task.presets)
+        # Overwriting a registered subclass keeps the registry size the same.
+        custom_objects[name] = NewTask
+        self.assertIn("presets_cache_test_1", Task.presets)
+        # Registering presets for a known class adds no subclasses.
+        register_test_presets("presets_cache_test_2")
+        self.assertIn("presets_cache_test_2", Task.presets)
+
     @pytest.mark.large
     def test_from_preset(self):
         self.assertIsInstance(
@@ -93,6 +131,23 @@ class TestTask(TestCase):
             # No loading on a non-keras model.
             CausalLM.from_preset("hf://spacy/en_core_web_sm")
 
+    def test_layers_without_preprocessor(self):
+        preprocessor = SimplePreprocessor()
+        model = SimpleTask(preprocessor)
+        self.assertNotIn(preprocessor, model.layers)
+        # Mutating the returned list should not affect the cached layers.
+        num_layers = len(model.layers)
+        model.layers.clear()
+        self.assertLen(model.layers, num_layers)
+        # Reassigning the preprocessor should drop the cached layers.
+        self.assertIn("_layers_cache", model.__dict__)
+        new_preprocessor = SimplePreprocessor()
+        model.preprocessor = new_preprocessor
+        self.assertNotIn("_layers_cache", model.__dict__)
+        self.assertNotIn(new_preprocessor, model.layers)
+        self.assertNotIn(preprocessor, model.layers)
+        self.assertIn("_layers_cache", model.__dict__)
+
     def test_summary_with_preprocessor(self):
         preprocessor = SimplePreprocessor()
         model = SimpleTask(preprocessor)
@@ -100,6 +155,18 @@ class TestTask(TestCase):
         model.summary(print_fn=lambda x, line_break=False: summary.append(x))
         self.assertRegex("\n".join(summary), "Preprocessor:")
 
+    def test_summary_preprocessor_before_model(self):
+        preprocessor = SimplePreprocessor()
+        model = SimpleTask(preprocessor)
+        summary = []
+        model.summary(print_fn=lambda x, line_break=False: summary.append(x))
+        # The preprocessor table is emitted with the model summary in one call.
+        self.assertIn("Preprocessor:", summary[0])
+        self.assertIn("Model:", summary[0])
+        self.assertLess(
+            summary[0].index("Preprocessor:"), summary[0].index("Model:")
+        )
+
     def test_summary_without_preprocessor(self):
         model = SimpleTask()
         summary = []
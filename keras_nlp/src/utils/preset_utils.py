@@ -78,6 +78,10 @@ SAFETENSOR_FILE = "model.safetensors"
 # Global state for preset registry.
 BUILTIN_PRESETS = {}
 BUILTIN_PRESETS_FOR_CLASS = collections.defaultdict(dict)
+# Merged presets per class, see `cached_presets()`. The version is bumped on
+# every `register_presets()` call to invalidate cached entries.
+PRESETS_CACHE = {}
+_presets_version = 0
 
 
 def register_presets(presets, classes):
@@ -86,10 +90,32 @@ def register_presets(presets, classes):
     Note that this is intended only for models and presets shipped in the
     library itself.
     """
+    global _presets_version
     for preset in presets:
         BUILTIN_PRESETS[preset] = presets[preset]
         for cls in classes:
             BUILTIN_PRESETS_FOR_CLASS[cls][preset] = presets[preset]
+    _presets_version += 1
+
+
+def cached_presets(cls, merge_presets):
+    """Return `merge_presets()` for a class, cached until registries change.
+
+    Cached entries are keyed on the preset registry version and on the
+    registered custom objects, so registering new presets or (re)registering
+    subclasses is picked up. Callers receive a copy of the cached dict.
+    """
+    key = (_presets_version, tuple(keras.saving.get_custom_objects().values()))
+    cached_key, presets = PRESETS_CACHE.get(cls, (None, None))
+    if cached_key != key:
+        presets = merge_presets()
+        PRESETS_CACHE[cls] = (key, presets)
+    return dict(presets)
+
+
+def clear_presets_cache():
+    """Clear all cached merged presets."""
+    PRESETS_CACHE.clear()
 
 
 def list_presets(cls):